@@ -2,11 +2,20 @@
 print("Hello from Kaggle!")
 print("Code executed successfully!")
 
-import subprocess
+import glob
+
+# GPU probe without spawning nvidia-smi: NVML if installed, else the driver's procfs
 try:
-    result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'], 
-                          capture_output=True, text=True, timeout=5)
-    if result.returncode == 0:
-        print(f"GPU: {result.stdout.strip()}")
-except:
-    print("No GPU or nvidia-smi not available")
+    import pynvml
+    pynvml.nvmlInit()
+    name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+    pynvml.nvmlShutdown()
+    print(f"GPU: {name.decode() if isinstance(name, bytes) else name}")
+except Exception:
+    gpus = glob.glob("/proc/driver/nvidia/gpus/*/information")
+    if gpus:
+        with open(gpus[0]) as f:
+            model = next((line.split(":", 1)[1].strip() for line in f if line.startswith("Model:")), "NVIDIA GPU")
+        print(f"GPU: {model}")
+    else:
+        print("No GPU or NVIDIA driver not available")
@@ -9,46 +9,96 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 from contextlib import AsyncExitStack
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Server parameters (command to start the server)
+DEFAULT_SERVER_PARAMS = StdioServerParameters(
+    command="python",
+    args=["-m", "src.server.mcp_server"],
+    env=None
+)
+
 
 class MCPClient:
-    """MCP client for interacting with the database server."""
+    """
+    MCP client for interacting with the database server.
+    
+    Use ``MCPClient.shared()`` to reuse one stdio server process and session
+    across callers in the same process:
+    
+        async with MCPClient.shared() as client:
+            await client.call_tool("query_database", {"sql": "SELECT 1"})
     
-    def __init__(self):
+    Each ``connect()`` takes a reference; the subprocess is only torn down
+    when the matching ``close()`` releases the last one. Close from the same
+    task that connected (the stdio transport is bound to it).
+    """
+    
+    _instances: dict[tuple, "MCPClient"] = {}
+    
+    def __init__(self, server_params: StdioServerParameters | None = None):
+        self.server_params = server_params or DEFAULT_SERVER_PARAMS
         self.session: ClientSession | None = None
         self.exit_stack = AsyncExitStack()
+        self._refcount = 0
+        self._connect_lock = asyncio.Lock()
+        self._tools_cache: list | None = None
+    
+    @classmethod
+    def shared(cls, server_params: StdioServerParameters | None = None) -> "MCPClient":
+        """Return the process-wide client for these server parameters."""
+        params = server_params or DEFAULT_SERVER_PARAMS
+        key = (params.command, tuple(params.args))
+        client = cls._instances.get(key)
+        if client is None:
+            client = cls(params)
+            cls._instances[key] = client
+        return client
+    
+    async def __aenter__(self) -> "MCPClient":
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
     
     async def connect(self):
-        """Connect to the MCP server via stdio."""
-        logger.info("Connecting to MCP server...")
-        
-        # Server parameters (command to start the server)
-        server_params = StdioServerParameters(
-            command="python",
-            args=["-m", "src.server.mcp_server"],
-            env=None
-        )
-        
-        # Establish connection
-        stdio_transport = await self.exit_stack.enter_async_context(
-            stdio_client(server_params)
-        )
-        self.stdio, self.write = stdio_transport
-        self.session = await self.exit_stack.enter_async_context(
-            ClientSession(self.stdio, self.write)
-        )
-        
-        # Initialize session
-        await self.session.initialize()
-        logger.info("Connected to MCP server successfully")
+        """Connect to the MCP server via stdio, reusing a live session."""
+        async with self._connect_lock:
+            self._refcount += 1
+            if self.session is not None:
+                return
+            
+            logger.info("Connecting to MCP server...")
+            try:
+                # Establish connection
+                stdio_transport = await self.exit_stack.enter_async_context(
+                    stdio_client(self.server_params)
+                )
+                self.stdio, self.write = stdio_transport
+                self.session = await self.exit_stack.enter_async_context(
+                    ClientSession(self.stdio, self.write)
+                )
+                
+                # Initialize session
+                await self.session.initialize()
+            except BaseException:
+                self._refcount -= 1
+                self.session = None
+                # Tear down whatever was entered (subprocess, transport)
+                try:
+                    await self.exit_stack.aclose()
+                finally:
+                    self.exit_stack = AsyncExitStack()
+                raise
+            logger.info("Connected to MCP server successfully")
     
     async def list_resources(self) -> list:
         """List all available resources."""
@@ -63,10 +113,12 @@ class MCPClient:
         return response.contents[0].text
     
     async def list_tools(self) -> list:
-        """List all available tools."""
-        logger.info("Listing tools...")
-        response = await self.session.list_tools()
-        return response.tools
+        """List all available tools (memoized for the life of the session)."""
+        if self._tools_cache is None:
+            logger.info("Listing tools...")
+            response = await self.session.list_tools()
+            self._tools_cache = response.tools
+        return self._tools_cache
     
     async def call_tool(self, name: str, arguments: dict) -> str:
         """Call a tool with arguments."""
@@ -93,40 +145,59 @@ class MCPClient:
         }
     
     async def close(self):
-        """Close the connection."""
-        await self.exit_stack.aclose()
+        """Release one reference; close the connection when none remain."""
+        if self._refcount == 0:
+            return
+        self._refcount -= 1
+        if self._refcount > 0:
+            return
+        
+        try:
+            await self.exit_stack.aclose()
+        finally:
+            self.session = None
+            self.exit_stack = AsyncExitStack()
+            self._tools_cache = None
+            key = (self.server_params.command, tuple(self.server_params.args))
+            if self._instances.get(key) is self:
+                del self._instances[key]
         logger.info("Connection closed")
 
 
-async def demo_resources(client: MCPClient):
+def pretty_json(payload: str) -> str:
+    """Re-indent a JSON payload for display (C-speed parse and encode)."""
+    return orjson.dumps(orjson.loads(payload), option=orjson.OPT_INDENT_2).decode()
+
+
+async def demo_resources(client: MCPClient, resources: list):
     """Demonstrate resource operations."""
     print("\n" + "="*60)
     print("DEMO: Resources (Schema & Metadata)")
     print("="*60)
     
-    resources = await client.list_resources()
     print(f"\nAvailable resources: {len(resources)}")
     for res in resources:
         print(f"  - {res.name} ({res.uri})")
     
-    # Read customer schema
+    # Read customer schema and database stats concurrently
+    schema, stats = await asyncio.gather(
+        client.read_resource("db://schema/customers"),
+        client.read_resource("db://stats/summary"),
+    )
+    
     print("\n--- Customer Schema ---")
-    schema = await client.read_resource("db://schema/customers")
-    print(json.dumps(json.loads(schema), indent=2))
+    print(pretty_json(schema))
     
-    # Read database stats
     print("\n--- Database Statistics ---")
-    stats = await client.read_resource("db://stats/summary")
-    print(json.dumps(json.loads(stats), indent=2))
+    print(pretty_json(stats))
 
 
-async def demo_tools(client: MCPClient):
+async def demo_tools(client: MCPClient, tools: list):
     """Demonstrate tool operations."""
     print("\n" + "="*60)
     print("DEMO: Tools (Actions & Queries)")
     print("="*60)
     
-    tools = await client.list_tools()
     print(f"\nAvailable tools: {len(tools)}")
     for tool in tools:
         print(f"  • {tool.name}: {tool.description}")
@@ -140,7 +211,7 @@ async def demo_tools(client: MCPClient):
             "limit": 10
         }
     )
-    print(json.dumps(json.loads(result), indent=2))
+    print(pretty_json(result))
     
     # Get customer orders
     print("\n--- Tool: get_customer_orders (Customer ID=1) ---")
@@ -148,7 +219,7 @@ async def demo_tools(client: MCPClient):
         "get_customer_orders",
         {"customer_id": 1}
     )
-    print(json.dumps(json.loads(result), indent=2))
+    print(pretty_json(result))
     
     # Analyze product sales
     print("\n--- Tool: analyze_product_sales (Electronics category) ---")
@@ -156,16 +227,15 @@ async def demo_tools(client: MCPClient):
         "analyze_product_sales",
         {"category": "Electronics", "top_n": 5}
     )
-    print(json.dumps(json.loads(result), indent=2))
+    print(pretty_json(result))
 
 
-async def demo_prompts(client: MCPClient):
+async def demo_prompts(client: MCPClient, prompts: list):
     """Demonstrate prompt templates."""
     print("\n" + "="*60)
     print("DEMO: Prompts (Workflow Templates)")
     print("="*60)
     
-    prompts = await client.list_prompts()
     print(f"\nAvailable prompts: {len(prompts)}")
     for prompt in prompts:
         print(f"  • {prompt.name}: {prompt.description}")
@@ -185,16 +255,23 @@ async def main():
     print("MCP Database Server - Client Demo")
     print("="*60)
     
-    client = MCPClient()
+    client = MCPClient.shared()
     
     try:
         # Connect to server
         await client.connect()
         
+        # Discover capabilities concurrently: one round-trip of latency, not three
+        resources, tools, prompts = await asyncio.gather(
+            client.list_resources(),
+            client.list_tools(),
+            client.list_prompts(),
+        )
+        
         # Run demos
-        await demo_resources(client)
-        await demo_tools(client)
-        await demo_prompts(client)
+        await demo_resources(client, resources)
+        await demo_tools(client, tools)
+        await demo_prompts(client, prompts)
         
         print("\n" + "="*60)
         print("[SUCCESS] All demos completed successfully!")
@@ -1,6 +1,6 @@
 """Database package initialization."""
 
-from .models import Base, Customer, Product, Order, OrderItem
+from .models import Base, Customer, Product, Order, OrderItem, OrderStatus
 from .connection import DatabaseManager, DatabaseConfig
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "Product",
     "Order",
     "OrderItem",
+    "OrderStatus",
     "DatabaseManager",
     "DatabaseConfig",
 ]
@@ -8,16 +8,69 @@ Production-grade connection handling with:
 - Type-safe session factory
 """
 
+import functools
 import os
-from contextlib import contextmanager
-from typing import Generator
-from sqlalchemy import create_engine, event, Engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncGenerator
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
 from .models import Base
 
 
+# Sync driver URL prefixes mapped to their asyncio-capable equivalents
+ASYNC_DRIVERS = {
+    "sqlite://": "sqlite+aiosqlite://",
+    "postgresql://": "postgresql+asyncpg://",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a plain driver URL to use an asyncio DBAPI driver."""
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if database_url.startswith(sync_prefix):
+            return async_prefix + database_url[len(sync_prefix):]
+    return database_url
+
+
+# Server connections: WAL lets readers proceed alongside a writer, and
+# synchronous=NORMAL only fsyncs at checkpoints instead of every commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Bulk loading only: no durability guarantees until the load completes
+SQLITE_BULK_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+@functools.cache
+def _default_db_url() -> str:
+    """DATABASE_URL from the environment, resolved once per process."""
+    return os.getenv("DATABASE_URL", "sqlite+aiosqlite:///data/mcp_demo.db")
+
+
+@functools.cache
+def _default_echo() -> bool:
+    """DB_ECHO from the environment, resolved once per process."""
+    return os.getenv("DB_ECHO", "false").lower() == "true"
+
+
 class DatabaseConfig:
     """Database configuration with sensible defaults."""
     
@@ -27,28 +80,39 @@ class DatabaseConfig:
         echo: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_min_size: int = 2,
+        fast_bulk: bool = False,
     ):
-        self.database_url = database_url or os.getenv(
-            "DATABASE_URL", "sqlite:///data/mcp_demo.db"
-        )
-        self.echo = echo or os.getenv("DB_ECHO", "false").lower() == "true"
+        self.database_url = to_async_url(database_url or _default_db_url())
+        self.echo = echo or _default_echo()
         self.pool_size = pool_size
         self.max_overflow = max_overflow
-        
-        # SQLite-specific: use StaticPool for in-memory, file-based uses default
-        self.is_sqlite = self.database_url.startswith("sqlite")
-        
-    def create_engine_kwargs(self) -> dict:
-        """Return engine kwargs based on database type."""
+        self.pool_min_size = pool_min_size  # Connections opened by warm_pool()
+        self.fast_bulk = fast_bulk  # SQLite: trade durability for load speed
+    
+    @functools.cached_property
+    def is_sqlite(self) -> bool:
+        """Whether the configured URL targets SQLite."""
+        return self.database_url.startswith("sqlite")
+    
+    @functools.cached_property
+    def engine_kwargs(self) -> dict:
+        """Engine kwargs based on database type (built once per config)."""
         kwargs = {
             "echo": self.echo,
         }
         
         if self.is_sqlite:
-            # SQLite specific settings
+            # SQLite-specific: StaticPool for in-memory, fixed persistent pool for files
             kwargs["connect_args"] = {"check_same_thread": False}
             if ":memory:" in self.database_url:
                 kwargs["poolclass"] = StaticPool
+            else:
+                # No overflow: overflow connections are closed on check-in, so
+                # every burst would reconnect and replay the PRAGMA hook
+                kwargs["poolclass"] = AsyncAdaptedQueuePool
+                kwargs["pool_size"] = self.pool_size
+                kwargs["max_overflow"] = 0
         else:
             # PostgreSQL/MySQL pool settings
             kwargs["pool_size"] = self.pool_size
@@ -60,50 +124,74 @@ class DatabaseConfig:
 
 class DatabaseManager:
     """
-    Manages database engine, session factory, and lifecycle.
+    Manages async database engine, session factory, and lifecycle.
     
     Usage:
         db = DatabaseManager()
-        db.init_db()  # Create tables
+        await db.init_db()  # Create tables
         
-        with db.get_session() as session:
-            customers = session.query(Customer).all()
+        async with db.get_session() as session:
+            result = await session.execute(select(Customer))
+            customers = result.scalars().all()
     """
     
     def __init__(self, config: DatabaseConfig | None = None):
         self.config = config or DatabaseConfig()
-        self.engine: Engine = create_engine(
+        self.engine: AsyncEngine = create_async_engine(
             self.config.database_url,
-            **self.config.create_engine_kwargs()
+            **self.config.engine_kwargs
         )
         
-        # Enable foreign keys for SQLite
+        # Enable foreign keys and tune SQLite (pool events live on the sync engine)
         if self.config.is_sqlite:
-            @event.listens_for(self.engine, "connect")
+            pragmas = SQLITE_BULK_PRAGMAS if self.config.fast_bulk else SQLITE_PRAGMAS
+            
+            @event.listens_for(self.engine.sync_engine, "connect")
             def set_sqlite_pragma(dbapi_conn, connection_record):
                 cursor = dbapi_conn.cursor()
                 cursor.execute("PRAGMA foreign_keys=ON")
+                for pragma in pragmas:
+                    cursor.execute(pragma)
                 cursor.close()
         
-        self.SessionFactory = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.SessionFactory = async_sessionmaker(
+            self.engine, expire_on_commit=False, class_=AsyncSession
+        )
     
-    def init_db(self) -> None:
+    async def init_db(self) -> None:
         """Create all tables defined in models."""
-        Base.metadata.create_all(self.engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     
-    def drop_all(self) -> None:
+    async def drop_all(self) -> None:
         """Drop all tables. Use with caution."""
-        Base.metadata.drop_all(self.engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+    
+    async def warm_pool(self) -> None:
+        """
+        Open ``pool_min_size`` connections up front.
+        
+        They are returned to the pool immediately, so early requests skip
+        the connect + PRAGMA setup cost.
+        """
+        if not isinstance(self.engine.pool, QueuePool):
+            return  # StaticPool: a single shared connection
+        
+        size = min(self.config.pool_min_size, self.engine.pool.size())
+        async with AsyncExitStack() as stack:
+            for _ in range(size):
+                await stack.enter_async_context(self.engine.connect())
     
-    @contextmanager
-    def get_session(self) -> Generator[Session, None, None]:
+    @asynccontextmanager
+    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """
-        Context manager for database sessions.
+        Async context manager for database sessions.
         
         Automatically handles commit/rollback and session cleanup.
         
         Example:
-            with db.get_session() as session:
+            async with db.get_session() as session:
                 customer = Customer(email="test@example.com", ...)
                 session.add(customer)
                 # Commit happens automatically on exit
@@ -111,17 +199,17 @@ class DatabaseManager:
         session = self.SessionFactory()
         try:
             yield session
-            session.commit()
+            await session.commit()
         except Exception:
-            session.rollback()
+            await session.rollback()
             raise
         finally:
-            session.close()
+            await session.close()
     
-    def get_session_factory(self) -> sessionmaker:
+    def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
         """Return the session factory for advanced use cases."""
         return self.SessionFactory
     
-    def close(self) -> None:
+    async def close(self) -> None:
         """Dispose of the connection pool."""
-        self.engine.dispose()
+        await self.engine.dispose()
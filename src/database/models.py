@@ -6,14 +6,19 @@ demonstrating how MCP can expose structured database resources to LLMs.
 
 Design decisions:
 - Using SQLAlchemy 2.0 declarative mapping for type safety
-- Composite indexes for common query patterns
-- Proper relationships with lazy loading control
-- Timestamps for audit trails
+- Money stored as integer cents, exposed in dollars via hybrid properties
+- Composite indexes for common query patterns; no standalone index on a
+  column that already leads a composite one
+- Collection relationships default to lazy="raise"; eager loads are explicit per query
+- Timestamps for audit trails, filled in by the database (CURRENT_TIMESTAMP)
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
-from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy import CheckConstraint, String, Integer, DateTime, ForeignKey, Index, func
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -22,6 +27,16 @@ class Base(DeclarativeBase):
     pass
 
 
+class OrderStatus(str, Enum):
+    """Lifecycle states of an order."""
+    
+    pending = "pending"
+    processing = "processing"
+    shipped = "shipped"
+    delivered = "delivered"
+    cancelled = "cancelled"
+
+
 class Customer(Base):
     """Customer entity with contact and demographic information."""
     
@@ -33,13 +48,14 @@ class Customer(Base):
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     phone: Mapped[Optional[str]] = mapped_column(String(20))
     country: Mapped[str] = mapped_column(String(100), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
     
     # Relationships
-    orders: Mapped[List["Order"]] = relationship("Order", back_populates="customer", lazy="selectin")
+    # lazy="raise": callers opt in via selectinload()/joinedload() at the query site
+    orders: Mapped[List["Order"]] = relationship("Order", back_populates="customer", lazy="raise")
     
     __table_args__ = (
         Index("idx_customer_name", "last_name", "first_name"),
@@ -58,22 +74,31 @@ class Product(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     sku: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(String(1000))
-    category: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    price: Mapped[float] = mapped_column(Float, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String(500))
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    price_cents: Mapped[int] = mapped_column(Integer, nullable=False)
     stock_quantity: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
     
     # Relationships
-    order_items: Mapped[List["OrderItem"]] = relationship("OrderItem", back_populates="product")
+    order_items: Mapped[List["OrderItem"]] = relationship("OrderItem", back_populates="product", lazy="raise")
     
     __table_args__ = (
-        Index("idx_product_category_price", "category", "price"),
+        # Leftmost column also serves category-only lookups; INCLUDE makes it covering on Postgres
+        Index(
+            "idx_product_category_price_id", "category", "price_cents", "id",
+            postgresql_include=["name", "sku"],
+        ),
     )
     
+    @hybrid_property
+    def price(self) -> float:
+        """Price in dollars."""
+        return self.price_cents / 100
+    
     def __repr__(self) -> str:
         return f"<Product(id={self.id}, sku='{self.sku}', name='{self.name}', price={self.price})>"
 
@@ -84,25 +109,26 @@ class Order(Base):
     __tablename__ = "orders"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False, index=True)
-    order_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    status: Mapped[str] = mapped_column(
-        String(50), 
-        nullable=False, 
-        default="pending",
-        index=True
-    )  # pending, processing, shipped, delivered, cancelled
-    total_amount: Mapped[float] = mapped_column(Float, nullable=False)
-    shipping_address: Mapped[str] = mapped_column(String(500), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False)
+    order_date: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    # Native ENUM type on Postgres; VARCHAR(10) on SQLite
+    status: Mapped[OrderStatus] = mapped_column(
+        SAEnum(OrderStatus, native_enum=True),
+        nullable=False,
+        default=OrderStatus.pending,
+    )
+    total_amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)
+    shipping_address: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
     
     # Relationships
     customer: Mapped["Customer"] = relationship("Customer", back_populates="orders")
+    # lazy="raise": an unplanned access fails loudly instead of issuing a hidden query
     order_items: Mapped[List["OrderItem"]] = relationship(
-        "OrderItem", back_populates="order", lazy="selectin", cascade="all, delete-orphan"
+        "OrderItem", back_populates="order", lazy="raise", cascade="all, delete-orphan"
     )
     
     __table_args__ = (
@@ -110,6 +136,11 @@ class Order(Base):
         Index("idx_order_status_date", "status", "order_date"),
     )
     
+    @hybrid_property
+    def total_amount(self) -> float:
+        """Order total in dollars."""
+        return self.total_amount_cents / 100
+    
     def __repr__(self) -> str:
         return f"<Order(id={self.id}, customer_id={self.customer_id}, status='{self.status}', total={self.total_amount})>"
 
@@ -120,11 +151,11 @@ class OrderItem(Base):
     __tablename__ = "order_items"
     
     id: Mapped[int] = mapped_column(primary_key=True)
-    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False, index=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False, index=True)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
-    unit_price: Mapped[float] = mapped_column(Float, nullable=False)  # Price snapshot at order time
-    subtotal: Mapped[float] = mapped_column(Float, nullable=False)
+    unit_price_cents: Mapped[int] = mapped_column(Integer, nullable=False)  # Price snapshot at order time
+    subtotal_cents: Mapped[int] = mapped_column(Integer, nullable=False)
     
     # Relationships
     order: Mapped["Order"] = relationship("Order", back_populates="order_items")
@@ -132,7 +163,19 @@ class OrderItem(Base):
     
     __table_args__ = (
         Index("idx_order_item_order_product", "order_id", "product_id"),
+        CheckConstraint("quantity > 0", name="ck_order_item_quantity_positive"),
+        CheckConstraint("unit_price_cents >= 0", name="ck_order_item_unit_price_nonnegative"),
     )
     
+    @hybrid_property
+    def unit_price(self) -> float:
+        """Unit price snapshot in dollars."""
+        return self.unit_price_cents / 100
+    
+    @hybrid_property
+    def subtotal(self) -> float:
+        """Line subtotal in dollars."""
+        return self.subtotal_cents / 100
+    
     def __repr__(self) -> str:
         return f"<OrderItem(id={self.id}, order_id={self.order_id}, product_id={self.product_id}, qty={self.quantity})>"
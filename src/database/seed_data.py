@@ -10,9 +10,12 @@ Creates realistic test data for demonstrating MCP capabilities:
 Run this script to populate a fresh database.
 """
 
+import asyncio
 import random
 from datetime import datetime, timedelta
-from src.database import DatabaseManager, Customer, Product, Order, OrderItem
+from sqlalchemy import func, insert, literal, select, text, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import DatabaseConfig, DatabaseManager, Customer, Product, Order, OrderItem, OrderStatus
 
 
 # Sample data generators
@@ -35,139 +38,211 @@ PRODUCT_NAMES = {
     "Toys": ["Board Game", "Action Figure", "Puzzle", "Building Blocks", "Doll", "RC Car"]
 }
 
-ORDER_STATUSES = ["pending", "processing", "shipped", "delivered", "cancelled"]
+# SKU prefixes, computed once rather than per generated product
+CATEGORY_PREFIX = {category: category[:3].upper() for category in PRODUCT_CATEGORIES}
 
 CITIES = ["New York", "Los Angeles", "London", "Berlin", "Paris", "Sydney", "Tokyo", "Mumbai"]
 
+# Tables reported in the post-seed summary, in display order
+SUMMARY_TABLES = [
+    ("Customers", Customer),
+    ("Products", Product),
+    ("Orders", Order),
+    ("Order Items", OrderItem),
+]
 
-def generate_customers(db: DatabaseManager, count: int = 50) -> list[Customer]:
+# Insert statements built once and reused for every executemany batch
+BULK_INSERTS = {model: insert(model) for model in (Customer, Product, Order, OrderItem)}
+
+
+async def _bulk_insert(session, model, rows: list[dict]) -> list[dict]:
+    """
+    Insert rows with one executemany and record their primary keys.
+    
+    Bypasses the ORM unit of work; each dict gets its generated ``id`` set
+    in place. Keys are read back rather than RETURNed: RETURNING with a
+    guaranteed row order makes SQLAlchemy fall back to one INSERT per row on
+    SQLite, and with a single writer new ids ascend in insertion order.
+    """
+    if not rows:
+        return rows
+    
+    last_id = await session.scalar(select(func.coalesce(func.max(model.id), 0)))
+    await session.execute(BULK_INSERTS[model], rows)
+    new_ids = await session.scalars(
+        select(model.id).where(model.id > last_id).order_by(model.id)
+    )
+    for row, pk in zip(rows, new_ids):
+        row["id"] = pk
+    return rows
+
+
+async def generate_customers(
+    session: AsyncSession, count: int = 50, rng: random.Random | None = None
+) -> list[dict]:
     """Generate random customer data."""
-    customers = []
+    rng = rng or random.Random()
+    now = datetime.utcnow()
+    first_names = rng.choices(FIRST_NAMES, k=count)
+    last_names = rng.choices(LAST_NAMES, k=count)
+    countries = rng.choices(COUNTRIES, k=count)
+    phones = rng.choices(range(1000, 10000), k=count)
+    day_offsets = rng.choices(range(366), k=count)
+    rows = [
+        {
+            "email": f"customer{i+1}@example.com",
+            "first_name": first_names[i],
+            "last_name": last_names[i],
+            "phone": f"+1-555-{phones[i]}",
+            "country": countries[i],
+            "created_at": now - timedelta(days=day_offsets[i]),
+        }
+        for i in range(count)
+    ]
     
-    with db.get_session() as session:
-        for i in range(count):
-            customer = Customer(
-                email=f"customer{i+1}@example.com",
-                first_name=random.choice(FIRST_NAMES),
-                last_name=random.choice(LAST_NAMES),
-                phone=f"+1-555-{random.randint(1000, 9999)}",
-                country=random.choice(COUNTRIES),
-                created_at=datetime.utcnow() - timedelta(days=random.randint(0, 365))
-            )
-            session.add(customer)
-            customers.append(customer)
-        
-        session.flush()  # Get IDs assigned
-        print(f"✓ Created {count} customers")
-        
-    return customers
-
-
-def generate_products(db: DatabaseManager, count: int = 100) -> list[Product]:
+    return await _bulk_insert(session, Customer, rows)
+
+
+async def generate_products(
+    session: AsyncSession, count: int = 100, rng: random.Random | None = None
+) -> list[dict]:
     """Generate random product catalog."""
-    products = []
+    rng = rng or random.Random()
+    now = datetime.utcnow()
+    categories = rng.choices(PRODUCT_CATEGORIES, k=count)
+    product_names = [rng.choice(PRODUCT_NAMES[category]) for category in categories]
+    models = rng.choices(["A", "B", "C", "D"], k=count)
+    prices = rng.choices(range(999, 100000), k=count)
+    stock = rng.choices(range(501), k=count)
+    day_offsets = rng.choices(range(181), k=count)
+    rows = [
+        {
+            "sku": f"SKU-{CATEGORY_PREFIX[category]}-{i+1:04d}",
+            "name": f"{product_name} - Model {models[i]}",
+            "description": f"High-quality {product_name.lower()} from {category} collection",
+            "category": category,
+            "price_cents": prices[i],
+            "stock_quantity": stock[i],
+            "created_at": now - timedelta(days=day_offsets[i]),
+        }
+        for i, (category, product_name) in enumerate(zip(categories, product_names))
+    ]
     
-    with db.get_session() as session:
-        for i in range(count):
-            category = random.choice(PRODUCT_CATEGORIES)
-            product_name = random.choice(PRODUCT_NAMES[category])
-            
-            product = Product(
-                sku=f"SKU-{category[:3].upper()}-{i+1:04d}",
-                name=f"{product_name} - Model {random.choice(['A', 'B', 'C', 'D'])}",
-                description=f"High-quality {product_name.lower()} from {category} collection",
-                category=category,
-                price=round(random.uniform(9.99, 999.99), 2),
-                stock_quantity=random.randint(0, 500),
-                created_at=datetime.utcnow() - timedelta(days=random.randint(0, 180))
-            )
-            session.add(product)
-            products.append(product)
-        
-        session.flush()
-        print(f"✓ Created {count} products across {len(PRODUCT_CATEGORIES)} categories")
-        
-    return products
-
-
-def generate_orders(
-    db: DatabaseManager, 
-    customers: list[Customer], 
-    products: list[Product],
-    count: int = 200
-) -> None:
+    return await _bulk_insert(session, Product, rows)
+
+
+async def generate_orders(
+    session: AsyncSession, 
+    customers: list[dict], 
+    products: list[dict],
+    count: int = 200,
+    rng: random.Random | None = None,
+) -> list[dict]:
     """Generate random orders with line items."""
+    rng = rng or random.Random()
+    now = datetime.utcnow()
+    order_customers = rng.choices(customers, k=count)
+    day_offsets = rng.choices(range(91), k=count)
+    statuses = rng.choices(list(OrderStatus), k=count)
+    street_numbers = rng.choices(range(100, 10000), k=count)
+    cities = rng.choices(CITIES, k=count)
+    order_rows = []
+    for i, customer in enumerate(order_customers):
+        order_date = now - timedelta(days=day_offsets[i])
+        order_rows.append({
+            "customer_id": customer["id"],
+            "order_date": order_date,
+            "status": statuses[i],
+            "total_amount_cents": 0,  # Filled in from line items below
+            "shipping_address": f"{street_numbers[i]} Main St, {cities[i]}, {customer['country']}",
+            "created_at": order_date,
+        })
+    orders = await _bulk_insert(session, Order, order_rows)
+    if not orders:
+        return orders
+    
+    # Add 1-5 distinct random products to each order
+    items_per_order = rng.choices(range(1, 6), k=count)
+    quantities = iter(rng.choices(range(1, 4), k=sum(items_per_order)))
+    item_rows = []
+    for order, num_items in zip(orders, items_per_order):
+        for product in rng.sample(products, num_items):
+            quantity = next(quantities)
+            item_rows.append({
+                "order_id": order["id"],
+                "product_id": product["id"],
+                "quantity": quantity,
+                "unit_price_cents": product["price_cents"],
+                "subtotal_cents": quantity * product["price_cents"],
+            })
+    await session.execute(BULK_INSERTS[OrderItem], item_rows)
     
-    with db.get_session() as session:
-        for i in range(count):
-            customer = random.choice(customers)
-            order_date = datetime.utcnow() - timedelta(days=random.randint(0, 90))
-            
-            # Create order
-            order = Order(
-                customer_id=customer.id,
-                order_date=order_date,
-                status=random.choice(ORDER_STATUSES),
-                total_amount=0.0,  # Will be calculated from items
-                shipping_address=f"{random.randint(100, 9999)} Main St, {random.choice(CITIES)}, {customer.country}",
-                created_at=order_date
-            )
-            session.add(order)
-            session.flush()  # Get order ID
-            
-            # Add 1-5 random items to order
-            num_items = random.randint(1, 5)
-            order_total = 0.0
-            
-            selected_products = random.sample(products, num_items)
-            for product in selected_products:
-                quantity = random.randint(1, 3)
-                unit_price = product.price
-                subtotal = round(quantity * unit_price, 2)
-                
-                order_item = OrderItem(
-                    order_id=order.id,
-                    product_id=product.id,
-                    quantity=quantity,
-                    unit_price=unit_price,
-                    subtotal=subtotal
-                )
-                session.add(order_item)
-                order_total += subtotal
-            
-            # Update order total
-            order.total_amount = round(order_total, 2)
-        
-        print(f"✓ Created {count} orders with line items")
-
-
-def seed_database(db: DatabaseManager) -> None:
-    """Main seeding function."""
+    # Compute the new orders' totals in one correlated UPDATE (exact integer SUM),
+    # bounded by the inserted id range so existing orders are left untouched
+    await session.execute(
+        update(Order)
+        .where(Order.id.between(orders[0]["id"], orders[-1]["id"]))
+        .values(
+            total_amount_cents=select(func.sum(OrderItem.subtotal_cents))
+            .where(OrderItem.order_id == Order.id)
+            .scalar_subquery()
+        )
+    )
+    return orders
+
+
+async def seed_database(db: DatabaseManager, seed: int | None = None) -> None:
+    """
+    Main seeding function.
+    
+    Pass ``seed`` to generate the same dataset on every run.
+    """
+    rng = random.Random(seed)
     print("🌱 Starting database seeding...")
     print("-" * 50)
     
     # Drop and recreate tables for fresh start
     print("Dropping existing tables...")
-    db.drop_all()
+    await db.drop_all()
     print("Creating fresh schema...")
-    db.init_db()
+    await db.init_db()
     print("-" * 50)
     
-    # Generate data
-    customers = generate_customers(db, count=50)
-    products = generate_products(db, count=100)
-    generate_orders(db, customers, products, count=200)
+    # Generate data in a single transaction: one commit for the whole load
+    async with db.get_session() as session:
+        customers = await generate_customers(session, count=50, rng=rng)
+        products = await generate_products(session, count=100, rng=rng)
+        orders = await generate_orders(session, customers, products, count=200, rng=rng)
+    
+    print(f"✓ Created {len(customers)} customers")
+    print(f"✓ Created {len(products)} products across {len(PRODUCT_CATEGORIES)} categories")
+    print(f"✓ Created {len(orders)} orders with line items")
     
     print("-" * 50)
     print("✅ Database seeding complete!")
     print("\nDatabase summary:")
-    with db.get_session() as session:
-        print(f"  • Customers: {session.query(Customer).count()}")
-        print(f"  • Products: {session.query(Product).count()}")
-        print(f"  • Orders: {session.query(Order).count()}")
-        print(f"  • Order Items: {session.query(OrderItem).count()}")
+    # All four counts in a single UNION ALL round-trip
+    summary = union_all(*(
+        select(literal(label), func.count()).select_from(model)
+        for label, model in SUMMARY_TABLES
+    ))
+    async with db.get_session() as session:
+        for label, count in (await session.execute(summary)).all():
+            print(f"  • {label}: {count}")
+
+
+async def main() -> None:
+    """Seed the configured database and release its connections."""
+    db = DatabaseManager(DatabaseConfig(fast_bulk=True))
+    try:
+        await seed_database(db)
+        if db.config.is_sqlite:
+            # Fold any WAL left from earlier server runs back into the main file
+            async with db.engine.begin() as conn:
+                await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    finally:
+        await db.close()
 
 
 if __name__ == "__main__":
-    db = DatabaseManager()
-    seed_database(db)
+    asyncio.run(main())
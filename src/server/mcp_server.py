@@ -11,9 +11,18 @@ Key capabilities:
 """
 
 import asyncio
-import json
+import atexit
 import logging
-from typing import Any
+import logging.handlers
+import queue
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+import msgspec
+import orjson
+import sqlglot
+from sqlglot import exp
+from sqlalchemy import Integer, bindparam, func, select
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.server.lowlevel.helper_types import ReadResourceContents
@@ -21,6 +30,7 @@ from mcp.types import (
     Resource,
     Tool,
     Prompt,
+    PromptArgument,
     TextContent,
     ImageContent,
     EmbeddedResource,
@@ -30,25 +40,305 @@ from mcp.types import (
     INTERNAL_ERROR,
 )
 
-from src.database import DatabaseManager, Customer, Product, Order, OrderItem
+from src.database import DatabaseManager, Customer, Product, Order, OrderItem, OrderStatus
 
-# Configure logging
+# Configure logging: handlers run on a QueueListener thread so file and
+# stderr writes never block the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('mcp_server.log'),
+    logging.StreamHandler(),
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('mcp_server.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response payload as indented JSON (orjson C encoder)."""
+    # default=str covers types orjson lacks natively, e.g. Decimal from NUMERIC
+    return orjson.dumps(obj, default=str, option=_JSON_OPTIONS).decode()
+
+
 # Initialize database
 db = DatabaseManager()
 
+# Schema creation and pool warm-up run in the background while the stdio
+# handshake proceeds; database-backed handlers await this before querying
+_db_ready: asyncio.Task | None = None
+
+
+async def _init_database() -> None:
+    """Create tables and pre-open pooled connections."""
+    logger.info("Initializing database...")
+    await db.init_db()
+    await db.warm_pool()
+    logger.info("Database ready")
+
+
+async def _ensure_db() -> None:
+    """Wait for background database initialization (no-op once done)."""
+    if _db_ready is not None:
+        await _db_ready
+
+
+# Back-pressure for bursty agents: at most one in-flight tool call per pooled
+# connection, so excess calls queue here instead of on the pool checkout
+_tool_slots = asyncio.Semaphore(db.config.pool_size)
+
 # Create MCP server instance
 server = Server("mcp-database-server")
 
+# Capability listings are constant: build the pydantic models once at import
+_RESOURCES: list[Resource] = [
+    Resource(
+        uri="db://schema/customers",
+        name="Customer Table Schema",
+        mimeType="application/json",
+        description="Schema definition and sample data for customers table"
+    ),
+    Resource(
+        uri="db://schema/products",
+        name="Product Table Schema",
+        mimeType="application/json",
+        description="Schema definition and sample data for products table"
+    ),
+    Resource(
+        uri="db://schema/orders",
+        name="Order Table Schema",
+        mimeType="application/json",
+        description="Schema definition and sample data for orders table"
+    ),
+    Resource(
+        uri="db://schema/order_items",
+        name="Order Items Table Schema",
+        mimeType="application/json",
+        description="Schema definition for order line items"
+    ),
+    Resource(
+        uri="db://stats/summary",
+        name="Database Statistics",
+        mimeType="application/json",
+        description="Summary statistics: record counts, value ranges, etc."
+    ),
+]
+
+_TOOLS: list[Tool] = [
+    Tool(
+        name="query_database",
+        description="Execute a read-only SQL SELECT query against the database. Returns JSON with a \"columns\" list and \"rows\" as arrays of values in column order. Query must be SELECT only (no INSERT/UPDATE/DELETE).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "SQL SELECT query to execute. Must be valid SQLite syntax."
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of rows to return (default: 100, max: 1000)",
+                    "default": 100
+                }
+            },
+            "required": ["sql"]
+        }
+    ),
+    Tool(
+        name="get_customer_orders",
+        description="Get all orders for a specific customer by customer ID or email.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "integer",
+                    "description": "Customer ID"
+                },
+                "email": {
+                    "type": "string",
+                    "description": "Customer email address"
+                }
+            },
+            "oneOf": [
+                {"required": ["customer_id"]},
+                {"required": ["email"]}
+            ]
+        }
+    ),
+    Tool(
+        name="analyze_product_sales",
+        description="Analyze sales performance for products in a specific category or overall.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Product category to analyze (optional, omit for all categories)"
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of top products to return (default: 10)",
+                    "default": 10
+                }
+            }
+        }
+    ),
+]
+
+_PROMPTS: list[Prompt] = [
+    Prompt(
+        name="analyze_customer",
+        description="Analyze a customer's purchase history and behavior",
+        arguments=[
+            PromptArgument(
+                name="customer_id",
+                description="Customer ID to analyze",
+                required=True
+            )
+        ]
+    ),
+    Prompt(
+        name="category_performance",
+        description="Generate a performance report for a product category",
+        arguments=[
+            PromptArgument(
+                name="category",
+                description="Product category name",
+                required=True
+            ),
+            PromptArgument(
+                name="period_days",
+                description="Analysis period in days (default: 30)",
+                required=False
+            )
+        ]
+    ),
+]
+
+# Statement nodes a read-only query must not contain anywhere in its AST
+_FORBIDDEN_NODES = (
+    exp.Insert, exp.Update, exp.Delete, exp.Merge,
+    exp.Create, exp.Drop, exp.Alter, exp.TruncateTable, exp.Command,
+)
+
+
+def _parse_read_only(sql: str) -> None:
+    """
+    Validate that sql is a single read-only query.
+    
+    The AST is only inspected: the caller's own text is what gets executed,
+    so functions and result column names stay exactly as written.
+    """
+    try:
+        statements = sqlglot.parse(sql, dialect="sqlite")
+    except sqlglot.errors.SqlglotError as e:
+        errors = getattr(e, "errors", None)
+        detail = errors[0]["description"] if errors else str(e)
+        raise ValueError(f"Invalid SQL: {detail}") from e
+    
+    if len(statements) != 1 or not isinstance(statements[0], exp.Query):
+        raise ValueError("Only a single SELECT query is allowed")
+    
+    parsed = statements[0]
+    if parsed.find(*_FORBIDDEN_NODES):
+        raise ValueError("Query contains forbidden statements")
+
+
+# Tool arguments, decoded and validated by msgspec in C. This replaces the
+# SDK's per-call jsonschema walk over the inputSchema declared in _TOOLS
+class QueryDBArgs(msgspec.Struct):
+    sql: str
+    limit: int = 100
+
+
+class CustomerOrdersArgs(msgspec.Struct):
+    customer_id: int | None = None
+    email: str | None = None
+
+    def __post_init__(self):
+        if (self.customer_id is None) == (self.email is None):
+            raise ValueError("Provide exactly one of customer_id or email")
+
+
+class AnalyzeSalesArgs(msgspec.Struct):
+    category: str | None = None
+    top_n: int = 10
+
+
+class CustomerInfo(msgspec.Struct):
+    id: int
+    name: str
+    email: str
+    country: str
+
+
+class OrderInfo(msgspec.Struct):
+    id: int
+    order_date: str
+    status: OrderStatus
+    total_amount: float
+    items_count: int
+
+
+class CustomerOrdersResp(msgspec.Struct):
+    """get_customer_orders payload, encoded by msgspec's schema-aware encoder."""
+    customer: CustomerInfo
+    orders: list[OrderInfo]
+    total_orders: int
+    total_spent: float
+
+
+# Tool queries built once at import: reusing the same Select objects keeps
+# SQLAlchemy's compiled-statement cache warm across calls
+_CUSTOMER = select(
+    Customer.id, Customer.first_name, Customer.last_name, Customer.email, Customer.country
+)
+_CUSTOMER_BY_ID = _CUSTOMER.where(Customer.id == bindparam("customer_id"))
+_CUSTOMER_BY_EMAIL = _CUSTOMER.where(Customer.email == bindparam("email"))
+# One row per order with its line-item count: no ORM objects, no per-order loads
+_CUSTOMER_ORDER_SUMMARIES = (
+    select(
+        Order.id,
+        Order.order_date,
+        Order.status,
+        Order.total_amount_cents,
+        func.count(OrderItem.id).label("items_count"),
+    )
+    .outerjoin(OrderItem)
+    .where(Order.customer_id == bindparam("customer_id"))
+    .group_by(Order.id)
+    .order_by(Order.order_date)
+)
+
+# Top sellers by revenue; category and top_n are bound per call
+_TOP_PRODUCTS_BASE = (
+    select(
+        Product.id,
+        Product.name,
+        Product.category,
+        Product.price_cents,
+        func.sum(OrderItem.quantity).label("total_quantity"),
+        func.sum(OrderItem.subtotal_cents).label("total_revenue_cents"),
+        func.count(OrderItem.id).label("order_count")
+    )
+    .join(OrderItem)
+    .group_by(Product.id)
+    .order_by(func.sum(OrderItem.subtotal_cents).desc())
+)
+_TOP_PRODUCTS = _TOP_PRODUCTS_BASE.limit(bindparam("top_n", type_=Integer))
+_TOP_PRODUCTS_IN_CATEGORY = (
+    _TOP_PRODUCTS_BASE
+    .where(Product.category == bindparam("category"))
+    .limit(bindparam("top_n", type_=Integer))
+)
+
 
 @server.list_resources()
 async def list_resources() -> list[Resource]:
@@ -57,38 +347,79 @@ async def list_resources() -> list[Resource]:
     
     Resources are read-only context that LLMs can reference.
     """
-    return [
-        Resource(
-            uri="db://schema/customers",
-            name="Customer Table Schema",
-            mimeType="application/json",
-            description="Schema definition and sample data for customers table"
-        ),
-        Resource(
-            uri="db://schema/products",
-            name="Product Table Schema",
-            mimeType="application/json",
-            description="Schema definition and sample data for products table"
-        ),
-        Resource(
-            uri="db://schema/orders",
-            name="Order Table Schema",
-            mimeType="application/json",
-            description="Schema definition and sample data for orders table"
-        ),
-        Resource(
-            uri="db://schema/order_items",
-            name="Order Items Table Schema",
-            mimeType="application/json",
-            description="Schema definition for order line items"
-        ),
-        Resource(
-            uri="db://stats/summary",
-            name="Database Statistics",
-            mimeType="application/json",
-            description="Summary statistics: record counts, value ranges, etc."
-        ),
-    ]
+    return _RESOURCES
+
+
+# Schema resources are static: serialize them once at import so reads are a dict lookup
+_STATIC_RESOURCES: dict[str, str] = {
+    "db://schema/customers": _dumps({
+        "table": "customers",
+        "description": "Customer master data with contact information",
+        "columns": [
+            {"name": "id", "type": "INTEGER", "primary_key": True},
+            {"name": "email", "type": "VARCHAR(255)", "unique": True, "indexed": True},
+            {"name": "first_name", "type": "VARCHAR(100)"},
+            {"name": "last_name", "type": "VARCHAR(100)"},
+            {"name": "phone", "type": "VARCHAR(20)", "nullable": True},
+            {"name": "country", "type": "VARCHAR(100)", "indexed": True},
+            {"name": "created_at", "type": "DATETIME"},
+            {"name": "updated_at", "type": "DATETIME"},
+        ],
+        "relationships": ["Has many Orders"],
+        "indexes": ["idx_customer_name (last_name, first_name)", "idx_customer_country (country)"],
+        "sample_query": "SELECT * FROM customers WHERE country = 'USA' LIMIT 10"
+    }),
+    "db://schema/products": _dumps({
+        "table": "products",
+        "description": "Product catalog with pricing and inventory",
+        "columns": [
+            {"name": "id", "type": "INTEGER", "primary_key": True},
+            {"name": "sku", "type": "VARCHAR(50)", "unique": True, "indexed": True},
+            {"name": "name", "type": "VARCHAR(255)"},
+            {"name": "description", "type": "VARCHAR(500)", "nullable": True},
+            {"name": "category", "type": "VARCHAR(100)", "indexed": True},
+            {"name": "price_cents", "type": "INTEGER", "unit": "cents"},
+            {"name": "stock_quantity", "type": "INTEGER"},
+            {"name": "created_at", "type": "DATETIME"},
+            {"name": "updated_at", "type": "DATETIME"},
+        ],
+        "relationships": ["Has many OrderItems"],
+        "indexes": ["idx_product_category_price_id (category, price_cents, id)"],
+        "sample_query": "SELECT * FROM products WHERE category = 'Electronics' ORDER BY price_cents DESC LIMIT 10"
+    }),
+    "db://schema/orders": _dumps({
+        "table": "orders",
+        "description": "Customer orders with status tracking",
+        "columns": [
+            {"name": "id", "type": "INTEGER", "primary_key": True},
+            {"name": "customer_id", "type": "INTEGER", "foreign_key": "customers.id", "indexed": True},
+            {"name": "order_date", "type": "DATETIME"},
+            {"name": "status", "type": "ENUM", "indexed": True, "values": [status.value for status in OrderStatus]},
+            {"name": "total_amount_cents", "type": "INTEGER", "unit": "cents"},
+            {"name": "shipping_address", "type": "VARCHAR(255)"},
+            {"name": "created_at", "type": "DATETIME"},
+            {"name": "updated_at", "type": "DATETIME"},
+        ],
+        "relationships": ["Belongs to Customer", "Has many OrderItems"],
+        "indexes": ["idx_order_customer_date (customer_id, order_date)", "idx_order_status_date (status, order_date)"],
+        "sample_query": "SELECT * FROM orders WHERE status = 'delivered' ORDER BY order_date DESC LIMIT 10"
+    }),
+    "db://schema/order_items": _dumps({
+        "table": "order_items",
+        "description": "Line items for orders with quantity and pricing snapshot",
+        "columns": [
+            {"name": "id", "type": "INTEGER", "primary_key": True},
+            {"name": "order_id", "type": "INTEGER", "foreign_key": "orders.id", "indexed": True},
+            {"name": "product_id", "type": "INTEGER", "foreign_key": "products.id", "indexed": True},
+            {"name": "quantity", "type": "INTEGER", "check": "quantity > 0"},
+            {"name": "unit_price_cents", "type": "INTEGER", "unit": "cents", "check": "unit_price_cents >= 0"},
+            {"name": "subtotal_cents", "type": "INTEGER", "unit": "cents"},
+        ],
+        "relationships": ["Belongs to Order", "Belongs to Product"],
+        "indexes": ["idx_order_item_order_product (order_id, product_id)"],
+        "sample_query": "SELECT * FROM order_items WHERE order_id = 1"
+    }),
+}
 
 
 @server.read_resource()
@@ -100,141 +431,103 @@ async def read_resource(uri: str) -> str | bytes:
     """
     # Convert AnyUrl to string if needed
     uri_str = str(uri)
-    logger.info(f"=== READ_RESOURCE CALLED ===")
-    logger.info(f"Original URI type: {type(uri)}")
-    logger.info(f"URI string: {repr(uri_str)}")
-    logger.info(f"Checking equality: {uri_str == 'db://schema/customers'}")
-    logger.info(f"==============================")
-    
-    content_text = ""
-    
-    if uri_str == "db://schema/customers":
-        logger.info("Matched customers schema")
-        content_text = json.dumps({
-            "table": "customers",
-            "description": "Customer master data with contact information",
-            "columns": [
-                {"name": "id", "type": "INTEGER", "primary_key": True},
-                {"name": "email", "type": "VARCHAR(255)", "unique": True, "indexed": True},
-                {"name": "first_name", "type": "VARCHAR(100)"},
-                {"name": "last_name", "type": "VARCHAR(100)"},
-                {"name": "phone", "type": "VARCHAR(20)", "nullable": True},
-                {"name": "country", "type": "VARCHAR(100)", "indexed": True},
-                {"name": "created_at", "type": "DATETIME"},
-                {"name": "updated_at", "type": "DATETIME"},
-            ],
-            "relationships": ["Has many Orders"],
-            "indexes": ["idx_customer_name (last_name, first_name)", "idx_customer_country (country)"],
-            "sample_query": "SELECT * FROM customers WHERE country = 'USA' LIMIT 10"
-        }, indent=2)
-    
-    elif uri_str == "db://schema/products":
-        content_text = json.dumps({
-            "table": "products",
-            "description": "Product catalog with pricing and inventory",
-            "columns": [
-                    {"name": "id", "type": "INTEGER", "primary_key": True},
-                    {"name": "sku", "type": "VARCHAR(50)", "unique": True, "indexed": True},
-                    {"name": "name", "type": "VARCHAR(255)"},
-                    {"name": "description", "type": "VARCHAR(1000)", "nullable": True},
-                    {"name": "category", "type": "VARCHAR(100)", "indexed": True},
-                    {"name": "price", "type": "FLOAT"},
-                    {"name": "stock_quantity", "type": "INTEGER"},
-                    {"name": "created_at", "type": "DATETIME"},
-                    {"name": "updated_at", "type": "DATETIME"},
-                ],
-            "relationships": ["Has many OrderItems"],
-            "indexes": ["idx_product_category_price (category, price)"],
-            "sample_query": "SELECT * FROM products WHERE category = 'Electronics' ORDER BY price DESC LIMIT 10"
-        }, indent=2)
-    
-    elif uri_str == "db://schema/orders":
-        content_text = json.dumps({
-            "table": "orders",
-            "description": "Customer orders with status tracking",
-            "columns": [
-                {"name": "id", "type": "INTEGER", "primary_key": True},
-                {"name": "customer_id", "type": "INTEGER", "foreign_key": "customers.id", "indexed": True},
-                {"name": "order_date", "type": "DATETIME"},
-                {"name": "status", "type": "VARCHAR(50)", "indexed": True, "values": ["pending", "processing", "shipped", "delivered", "cancelled"]},
-                {"name": "total_amount", "type": "FLOAT"},
-                {"name": "shipping_address", "type": "VARCHAR(500)"},
-                {"name": "created_at", "type": "DATETIME"},
-                {"name": "updated_at", "type": "DATETIME"},
-            ],
-            "relationships": ["Belongs to Customer", "Has many OrderItems"],
-            "indexes": ["idx_order_customer_date (customer_id, order_date)", "idx_order_status_date (status, order_date)"],
-            "sample_query": "SELECT * FROM orders WHERE status = 'delivered' ORDER BY order_date DESC LIMIT 10"
-        }, indent=2)
-    
-    elif uri_str == "db://schema/order_items":
-        content_text = json.dumps({
-            "table": "order_items",
-            "description": "Line items for orders with quantity and pricing snapshot",
-            "columns": [
-                {"name": "id", "type": "INTEGER", "primary_key": True},
-                {"name": "order_id", "type": "INTEGER", "foreign_key": "orders.id", "indexed": True},
-                {"name": "product_id", "type": "INTEGER", "foreign_key": "products.id", "indexed": True},
-                {"name": "quantity", "type": "INTEGER"},
-                {"name": "unit_price", "type": "FLOAT"},
-                {"name": "subtotal", "type": "FLOAT"},
-            ],
-            "relationships": ["Belongs to Order", "Belongs to Product"],
-            "indexes": ["idx_order_item_order_product (order_id, product_id)"],
-            "sample_query": "SELECT * FROM order_items WHERE order_id = 1"
-        }, indent=2)
-    
-    elif uri_str == "db://stats/summary":
-        # Generate live statistics
-        with db.get_session() as session:
-            stats = {
-                "record_counts": {
-                    "customers": session.query(Customer).count(),
-                    "products": session.query(Product).count(),
-                    "orders": session.query(Order).count(),
-                    "order_items": session.query(OrderItem).count(),
-                },
-                "order_status_distribution": _get_order_status_dist(session),
-                "product_categories": _get_product_categories(session),
-                "date_range": _get_date_range(session),
-            }
-            content_text = json.dumps(stats, indent=2, default=str)
-    
-    else:
-        logger.error(f"Unknown resource URI: {uri}")
-        raise ValueError(f"Unknown resource URI: {uri}")
+    content_text = _STATIC_RESOURCES.get(uri_str)
+    if content_text is None:
+        content_text = await _read_dynamic_resource(uri_str)
     
     # Return plain string - SDK will wrap it
-    logger.info(f"Returning content for {uri}, length: {len(content_text)}")
+    logger.debug("Returning content for %s, length: %d", uri_str, len(content_text))
     return content_text
 
 
-def _get_order_status_dist(session) -> dict[str, int]:
-    """Helper to get order status distribution."""
-    from sqlalchemy import func
-    results = session.query(
-        Order.status, func.count(Order.id)
-    ).group_by(Order.status).all()
-    return {status: count for status, count in results}
+async def _read_dynamic_resource(uri_str: str) -> str:
+    """Build resources whose content depends on live data."""
+    if uri_str == "db://stats/summary":
+        await _ensure_db()
+        return await _read_stats_summary()
+    
+    logger.error(f"Unknown resource URI: {uri_str}")
+    raise ValueError(f"Unknown resource URI: {uri_str}")
+
+
+# Stats change slowly: serve a cached payload for up to _STATS_TTL seconds
+_STATS_TTL = 30.0
+_stats_cache: tuple[float, str] | None = None
+_stats_lock = asyncio.Lock()
+
 
+def _cached_stats() -> str | None:
+    """Return the cached stats payload if it is still fresh."""
+    if _stats_cache is not None and time.monotonic() - _stats_cache[0] < _STATS_TTL:
+        return _stats_cache[1]
+    return None
+
+
+async def _read_stats_summary() -> str:
+    """Return live statistics, recomputing at most once per TTL."""
+    global _stats_cache
+    payload = _cached_stats()
+    if payload is not None:
+        return payload
+    
+    # Coalesce concurrent misses: one caller recomputes, the rest reuse it
+    async with _stats_lock:
+        payload = _cached_stats()
+        if payload is None:
+            payload = _dumps(await _compute_stats())
+            _stats_cache = (time.monotonic(), payload)
+    return payload
+
+
+def _scalar(stmt, label: str):
+    """Label a single-value select for use as a column of _STATS_TOTALS."""
+    return stmt.scalar_subquery().label(label)
+
+
+# Record counts and the order date range in a single row
+_STATS_TOTALS = select(
+    _scalar(select(func.count()).select_from(Customer), "customers"),
+    _scalar(select(func.count()).select_from(Product), "products"),
+    _scalar(select(func.count()).select_from(Order), "orders"),
+    _scalar(select(func.count()).select_from(OrderItem), "order_items"),
+    _scalar(select(func.min(Order.order_date)), "earliest_order"),
+    _scalar(select(func.max(Order.order_date)), "latest_order"),
+)
+_STATUS_DISTRIBUTION = select(Order.status, func.count(Order.id)).group_by(Order.status)
+_PRODUCT_CATEGORIES = select(Product.category).distinct()
 
-def _get_product_categories(session) -> list[str]:
-    """Helper to get unique product categories."""
-    from sqlalchemy import func
-    results = session.query(Product.category).distinct().all()
-    return [cat[0] for cat in results]
 
+async def _fetch_all(stmt) -> list:
+    """Run a read-only statement on its own session and return all rows."""
+    async with db.get_session() as session:
+        return (await session.execute(stmt)).all()
 
-def _get_date_range(session) -> dict[str, str]:
-    """Helper to get order date range."""
-    from sqlalchemy import func
-    result = session.query(
-        func.min(Order.order_date),
-        func.max(Order.order_date)
-    ).first()
+
+async def _compute_stats() -> dict:
+    """
+    Collect summary statistics in three statements.
+    
+    The statements are independent, so they run concurrently on separate
+    pooled connections (WAL lets SQLite readers proceed in parallel).
+    """
+    (totals,), statuses, categories = await asyncio.gather(
+        _fetch_all(_STATS_TOTALS),
+        _fetch_all(_STATUS_DISTRIBUTION),
+        _fetch_all(_PRODUCT_CATEGORIES),
+    )
     return {
-        "earliest_order": str(result[0]) if result[0] else None,
-        "latest_order": str(result[1]) if result[1] else None
+        "record_counts": {
+            "customers": totals.customers,
+            "products": totals.products,
+            "orders": totals.orders,
+            "order_items": totals.order_items,
+        },
+        "order_status_distribution": {status.value: count for status, count in statuses},
+        "product_categories": [category for (category,) in categories],
+        "date_range": {
+            "earliest_order": str(totals.earliest_order) if totals.earliest_order else None,
+            "latest_order": str(totals.latest_order) if totals.latest_order else None,
+        },
     }
 
 
@@ -243,69 +536,10 @@ async def list_tools() -> list[Tool]:
     """
     List available tools (actions) that LLMs can invoke.
     """
-    return [
-        Tool(
-            name="query_database",
-            description="Execute a read-only SQL SELECT query against the database. Returns results as JSON. Query must be SELECT only (no INSERT/UPDATE/DELETE).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sql": {
-                        "type": "string",
-                        "description": "SQL SELECT query to execute. Must be valid SQLite syntax."
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of rows to return (default: 100, max: 1000)",
-                        "default": 100
-                    }
-                },
-                "required": ["sql"]
-            }
-        ),
-        Tool(
-            name="get_customer_orders",
-            description="Get all orders for a specific customer by customer ID or email.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "integer",
-                        "description": "Customer ID"
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Customer email address"
-                    }
-                },
-                "oneOf": [
-                    {"required": ["customer_id"]},
-                    {"required": ["email"]}
-                ]
-            }
-        ),
-        Tool(
-            name="analyze_product_sales",
-            description="Analyze sales performance for products in a specific category or overall.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Product category to analyze (optional, omit for all categories)"
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "Number of top products to return (default: 10)",
-                        "default": 10
-                    }
-                }
-            }
-        ),
-    ]
+    return _TOOLS
 
 
-@server.call_tool()
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """
     Execute a tool with given arguments.
@@ -315,143 +549,174 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     logger.info(f"Tool call: {name} with arguments: {arguments}")
     
     try:
-        if name == "query_database":
-            return await _tool_query_database(arguments)
-        elif name == "get_customer_orders":
-            return await _tool_get_customer_orders(arguments)
-        elif name == "analyze_product_sales":
-            return await _tool_analyze_product_sales(arguments)
-        else:
+        entry = _TOOL_HANDLERS.get(name)
+        if entry is None:
             raise ValueError(f"Unknown tool: {name}")
+        arg_type, handler = entry
+        
+        try:
+            args = msgspec.convert(arguments, arg_type)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Input validation error: {e}") from e
+        
+        await _ensure_db()
+        async with _tool_slots:
+            return await handler(args)
     
     except Exception as e:
         logger.error(f"Error executing tool {name}: {e}")
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e), "tool": name})
+            text=orjson.dumps({"error": str(e), "tool": name}).decode()
         )]
 
 
-async def _tool_query_database(arguments: dict) -> list[TextContent]:
+# Agents re-issue the same read-only SQL while reasoning: keep the most
+# recent payloads keyed by (SQL text, limit), each fresh for a TTL. The key
+# is the exact text executed, since result column names derive from it
+_QUERY_CACHE_MAX = 256
+_QUERY_CACHE_TTL = 30.0
+_query_cache: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+
+
+def _cached_query(key: tuple[str, int]) -> str | None:
+    """Return a fresh cached query payload, marking it most recently used."""
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _QUERY_CACHE_TTL:
+        del _query_cache[key]
+        return None
+    _query_cache.move_to_end(key)
+    return entry[1]
+
+
+def _store_query(key: tuple[str, int], payload: str) -> None:
+    """Cache a query payload, evicting the least recently used past the bound."""
+    _query_cache[key] = (time.monotonic(), payload)
+    _query_cache.move_to_end(key)
+    if len(_query_cache) > _QUERY_CACHE_MAX:
+        _query_cache.popitem(last=False)
+
+
+async def _tool_query_database(args: QueryDBArgs) -> list[TextContent]:
     """Execute raw SQL query with safety checks."""
-    sql = arguments.get("sql", "").strip().upper()
-    limit = min(arguments.get("limit", 100), 1000)
-    
-    # Safety: only allow SELECT
-    if not sql.startswith("SELECT"):
-        raise ValueError("Only SELECT queries are allowed")
+    limit = min(args.limit, 1000)
     
-    # Safety: block dangerous keywords
-    forbidden = ["DROP", "DELETE", "INSERT", "UPDATE", "ALTER", "CREATE", "TRUNCATE"]
-    if any(keyword in sql for keyword in forbidden):
-        raise ValueError(f"Query contains forbidden keywords: {forbidden}")
+    # Safety: validate structurally on the parsed AST, so keywords inside
+    # string literals or identifiers are not false positives
+    sql = args.sql.strip()
+    _parse_read_only(sql)
     
-    # Execute in thread pool (SQLAlchemy is sync)
-    def _execute():
-        with db.get_session() as session:
-            result = session.execute(arguments["sql"])
-            rows = result.fetchmany(limit)
-            columns = result.keys()
-            return [dict(zip(columns, row)) for row in rows]
+    key = (sql, limit)
+    payload = _cached_query(key)
+    if payload is not None:
+        return [TextContent(type="text", text=payload)]
     
-    results = await asyncio.to_thread(_execute)
+    # Async session: SQL I/O yields to the event loop
+    async with db.get_session() as session:
+        # Driver-level execution: text() would treat any ":word" (even inside
+        # string literals, e.g. json '{"a":1}') as a bind parameter
+        conn = await session.connection()
+        result = await conn.exec_driver_sql(sql)
+        columns = list(result.keys())
+        # Columnar shape: column names once, then one value array per row.
+        # map(tuple, ...) converts the whole batch without a Python-level loop
+        rows = list(map(tuple, result.fetchmany(limit)))
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({
-            "rows": results,
-            "count": len(results),
-            "truncated": len(results) == limit
-        }, indent=2, default=str)
-    )]
+    payload = _dumps({
+        "columns": columns,
+        "rows": rows,
+        "count": len(rows),
+        "truncated": len(rows) == limit
+    })
+    _store_query(key, payload)
+    return [TextContent(type="text", text=payload)]
 
 
-async def _tool_get_customer_orders(arguments: dict) -> list[TextContent]:
+async def _tool_get_customer_orders(args: CustomerOrdersArgs) -> list[TextContent]:
     """Get customer orders by ID or email."""
-    def _execute():
-        with db.get_session() as session:
-            # Find customer
-            if "customer_id" in arguments:
-                customer = session.query(Customer).filter_by(id=arguments["customer_id"]).first()
-            else:
-                customer = session.query(Customer).filter_by(email=arguments["email"]).first()
-            
-            if not customer:
-                return {"error": "Customer not found"}
-            
-            # Get orders with items
-            orders = session.query(Order).filter_by(customer_id=customer.id).all()
-            
-            return {
-                "customer": {
-                    "id": customer.id,
-                    "name": f"{customer.first_name} {customer.last_name}",
-                    "email": customer.email,
-                    "country": customer.country
-                },
-                "orders": [
-                    {
-                        "id": order.id,
-                        "order_date": str(order.order_date),
-                        "status": order.status,
-                        "total_amount": order.total_amount,
-                        "items_count": len(order.order_items)
-                    }
-                    for order in orders
-                ],
-                "total_orders": len(orders),
-                "total_spent": sum(order.total_amount for order in orders)
-            }
+    async with db.get_session() as session:
+        # Find customer
+        if args.customer_id is not None:
+            customer = (await session.execute(
+                _CUSTOMER_BY_ID, {"customer_id": args.customer_id}
+            )).first()
+        else:
+            customer = (await session.execute(
+                _CUSTOMER_BY_EMAIL, {"email": args.email}
+            )).first()
+        
+        if not customer:
+            return [TextContent(type="text", text=_dumps({"error": "Customer not found"}))]
+        
+        # Orders with item counts in a single aggregate query
+        orders = (await session.execute(
+            _CUSTOMER_ORDER_SUMMARIES, {"customer_id": customer.id}
+        )).all()
     
-    result = await asyncio.to_thread(_execute)
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-
-async def _tool_analyze_product_sales(arguments: dict) -> list[TextContent]:
+    result = CustomerOrdersResp(
+        customer=CustomerInfo(
+            id=customer.id,
+            name=f"{customer.first_name} {customer.last_name}",
+            email=customer.email,
+            country=customer.country
+        ),
+        orders=[
+            OrderInfo(
+                id=order.id,
+                order_date=str(order.order_date),
+                status=order.status,
+                total_amount=order.total_amount_cents / 100,
+                items_count=order.items_count
+            )
+            for order in orders
+        ],
+        total_orders=len(orders),
+        total_spent=sum(order.total_amount_cents for order in orders) / 100
+    )
+    # Same 2-space layout as _dumps, so every tool emits one format
+    payload = msgspec.json.format(msgspec.json.encode(result), indent=2)
+    return [TextContent(type="text", text=payload.decode())]
+
+
+async def _tool_analyze_product_sales(args: AnalyzeSalesArgs) -> list[TextContent]:
     """Analyze product sales by category."""
-    category = arguments.get("category")
-    top_n = arguments.get("top_n", 10)
+    category = args.category
     
-    def _execute():
-        with db.get_session() as session:
-            from sqlalchemy import func
-            
-            query = session.query(
-                Product.id,
-                Product.name,
-                Product.category,
-                Product.price,
-                func.sum(OrderItem.quantity).label("total_quantity"),
-                func.sum(OrderItem.subtotal).label("total_revenue"),
-                func.count(OrderItem.id).label("order_count")
-            ).join(OrderItem).group_by(Product.id)
-            
-            if category:
-                query = query.filter(Product.category == category)
-            
-            query = query.order_by(func.sum(OrderItem.subtotal).desc()).limit(top_n)
-            
-            results = query.all()
-            
-            return {
-                "category": category or "All Categories",
-                "top_products": [
-                    {
-                        "product_id": r.id,
-                        "name": r.name,
-                        "category": r.category,
-                        "price": r.price,
-                        "units_sold": r.total_quantity,
-                        "total_revenue": round(r.total_revenue, 2),
-                        "orders_count": r.order_count
-                    }
-                    for r in results
-                ],
-                "count": len(results)
-            }
+    async with db.get_session() as session:
+        if category:
+            results = (await session.execute(
+                _TOP_PRODUCTS_IN_CATEGORY, {"category": category, "top_n": args.top_n}
+            )).all()
+        else:
+            results = (await session.execute(_TOP_PRODUCTS, {"top_n": args.top_n})).all()
     
-    result = await asyncio.to_thread(_execute)
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    result = {
+        "category": category or "All Categories",
+        "top_products": [
+            {
+                "product_id": r.id,
+                "name": r.name,
+                "category": r.category,
+                "price": r.price_cents / 100,
+                "units_sold": r.total_quantity,
+                "total_revenue": r.total_revenue_cents / 100,
+                "orders_count": r.order_count
+            }
+            for r in results
+        ],
+        "count": len(results)
+    }
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+# Tool name -> (argument Struct, handler)
+_TOOL_HANDLERS: dict[str, tuple[type[msgspec.Struct], Callable[[Any], Awaitable[list[TextContent]]]]] = {
+    "query_database": (QueryDBArgs, _tool_query_database),
+    "get_customer_orders": (CustomerOrdersArgs, _tool_get_customer_orders),
+    "analyze_product_sales": (AnalyzeSalesArgs, _tool_analyze_product_sales),
+}
 
 
 @server.list_prompts()
@@ -461,58 +726,12 @@ async def list_prompts() -> list[Prompt]:
     
     Prompts are pre-defined workflows that LLMs can invoke with parameters.
     """
-    from mcp.types import PromptArgument
-    
-    return [
-        Prompt(
-            name="analyze_customer",
-            description="Analyze a customer's purchase history and behavior",
-            arguments=[
-                PromptArgument(
-                    name="customer_id",
-                    description="Customer ID to analyze",
-                    required=True
-                )
-            ]
-        ),
-        Prompt(
-            name="category_performance",
-            description="Generate a performance report for a product category",
-            arguments=[
-                PromptArgument(
-                    name="category",
-                    description="Product category name",
-                    required=True
-                ),
-                PromptArgument(
-                    name="period_days",
-                    description="Analysis period in days (default: 30)",
-                    required=False
-                )
-            ]
-        ),
-    ]
+    return _PROMPTS
 
 
-@server.get_prompt()
-async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
-    """
-    Get a specific prompt with arguments populated.
-    
-    Returns a structured prompt that the LLM can execute.
-    """
-    args = arguments or {}
-    
-    if name == "analyze_customer":
-        customer_id = args.get("customer_id")
-        return GetPromptResult(
-            description=f"Analyze customer {customer_id}",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""Please analyze customer {customer_id} using the following steps:
+# Prompt texts are fixed apart from the injected arguments: keep the
+# templates as constants and only .format() them per request
+_ANALYZE_CUSTOMER_TMPL = """Please analyze customer {customer_id} using the following steps:
 
 1. Use the `get_customer_orders` tool to retrieve all orders for customer_id={customer_id}
 2. Analyze their purchase patterns:
@@ -526,22 +745,8 @@ async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptRe
    - Potential upsell opportunities
 
 Format the analysis professionally with clear sections and actionable insights."""
-                    )
-                )
-            ]
-        )
-    
-    elif name == "category_performance":
-        category = args.get("category")
-        period_days = args.get("period_days", "30")
-        return GetPromptResult(
-            description=f"Analyze performance for {category} category",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"""Generate a performance report for the '{category}' product category:
+
+_CATEGORY_PERFORMANCE_TMPL = """Generate a performance report for the '{category}' product category:
 
 1. Use `analyze_product_sales` tool with category='{category}' to get top products
 2. Use `query_database` to find:
@@ -555,22 +760,69 @@ Format the analysis professionally with clear sections and actionable insights."
    - Pricing optimization opportunities
 
 Present findings in a executive summary format suitable for leadership."""
-                    )
+
+
+def _prompt_analyze_customer(args: dict[str, str]) -> GetPromptResult:
+    """Customer analysis workflow."""
+    customer_id = args.get("customer_id")
+    return GetPromptResult(
+        description=f"Analyze customer {customer_id}",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text=_ANALYZE_CUSTOMER_TMPL.format(customer_id=customer_id)
                 )
-            ]
-        )
+            )
+        ]
+    )
+
+
+def _prompt_category_performance(args: dict[str, str]) -> GetPromptResult:
+    """Category performance report workflow."""
+    category = args.get("category")
+    period_days = args.get("period_days", "30")
+    return GetPromptResult(
+        description=f"Analyze performance for {category} category",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text=_CATEGORY_PERFORMANCE_TMPL.format(category=category, period_days=period_days)
+                )
+            )
+        ]
+    )
+
+
+_PROMPT_BUILDERS: dict[str, Callable[[dict[str, str]], GetPromptResult]] = {
+    "analyze_customer": _prompt_analyze_customer,
+    "category_performance": _prompt_category_performance,
+}
+
+
+@server.get_prompt()
+async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
+    """
+    Get a specific prompt with arguments populated.
     
-    else:
+    Returns a structured prompt that the LLM can execute.
+    """
+    builder = _PROMPT_BUILDERS.get(name)
+    if builder is None:
         raise ValueError(f"Unknown prompt: {name}")
+    return builder(arguments or {})
 
 
 async def main():
     """Main entry point for MCP server."""
+    global _db_ready
     logger.info("Starting MCP Database Server")
     
-    # Initialize database
-    logger.info("Initializing database...")
-    db.init_db()
+    # Initialize database without holding up the stdio transport
+    _db_ready = asyncio.create_task(_init_database())
     
     # Run server with stdio transport
     async with stdio_server() as (read_stream, write_stream):
@@ -582,5 +834,20 @@ async def main():
         )
 
 
+def _install_fast_event_loop() -> None:
+    """Use uvloop (winloop on Windows) for the stdio loop when installed."""
+    try:
+        import uvloop as fast_loop
+    except ImportError:
+        try:
+            import winloop as fast_loop
+        except ImportError:
+            logger.info("uvloop/winloop not installed; using the default asyncio loop")
+            return
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    logger.info(f"Using {fast_loop.__name__} event loop")
+
+
 if __name__ == "__main__":
+    _install_fast_event_loop()
     asyncio.run(main())